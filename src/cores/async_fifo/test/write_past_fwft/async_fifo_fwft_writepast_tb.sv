@@ -77,6 +77,19 @@ always @(posedge rd_clk) begin
   end
 end
 
+// Status flags must never be unknown once reset has been released
+always @(posedge wr_clk) begin
+  if( rst === 1'b0 ) begin
+    `CHECK_EQUAL( ^full === 1'bx, 1'b0 );
+  end
+end
+
+always @(posedge rd_clk) begin
+  if( rst === 1'b0 ) begin
+    `CHECK_EQUAL( ^{empty, has_data} === 1'bx, 1'b0 );
+  end
+end
+
 `TEST_SUITE begin
 
   `TEST_CASE("Write-Past") begin